@@ -3,27 +3,51 @@
 Esprit Connect Job Scraper
 
 Authenticates to Esprit Connect and scrapes job postings starting from job ID 785
-until it encounters a non-existent job (which redirects to home page).
+until it encounters a run of non-existent jobs (which redirect to home page).
 """
 
 import os
+import re
 import sys
-import json
 import time
+import asyncio
+import atexit
+import hashlib
+import heapq
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Union
+from html import unescape
+from dataclasses import dataclass, asdict, fields
+from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 import logging
 
+import aiohttp
+import ijson
+import orjson
+from yarl import URL
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
+
+try:
+    from generate_feeds import generate_all_feeds
+except ImportError:
+    generate_all_feeds = None
+
+try:
+    from rbloom import Bloom
+except ImportError:
+    Bloom = None
 
 # Configure logging
 logging.basicConfig(
@@ -68,8 +92,277 @@ def load_credentials():
 # Load credentials at module level
 ESPRIT_EMAIL, ESPRIT_PASSWORD = load_credentials()
 
+# Append-only archive of every scraped job, one JSON object per line
+JOBS_ARCHIVE_FILE = "jobs_raw.ndjson"
+# One job ID per line, written next to the archive for fast duplicate checks
+JOBS_INDEX_FILE = "jobs_index.txt"
+# Bloom filter over the archived job IDs, only used for large archives
+JOBS_BLOOM_FILE = "jobs_ids.bloom"
+BLOOM_MIN_JOBS = 10_000
+BLOOM_CAPACITY = 100_000
+BLOOM_ERROR_RATE = 0.001
+# Bloom hits are confirmed against the archived IDs at most this far below
+# the resume point, read from the tail of the sorted index
+RECENT_ID_WINDOW = 1000
+
+# HTTP fetching: at most MAX_CONCURRENT_REQUESTS requests in flight, job IDs
+# are probed FETCH_BATCH_SIZE at a time
+MAX_CONCURRENT_REQUESTS = 10
+FETCH_BATCH_SIZE = 20
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+# Known jobs probed before a run to check if HTTP returns rendered pages
+HTTP_CHECK_PROBES = 3
+# Deleted jobs leave gaps in the IDs, so the catalog only ends after this
+# many missing IDs in a row
+MAX_CONSECUTIVE_MISSES = 10
+# Present only in server-rendered job pages; without it we need the browser
+JOB_PAGE_MARKER = 'jobPageJobTitle'
+# Seconds to wait for a job page to render in Chrome
+JOB_PAGE_TIMEOUT = 5
+# Resources Chrome never needs to download: we only read text and image URLs
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*google-analytics*', '*googletagmanager*', '*doubleclick*',
+]
+
+# JSON endpoint the Angular job page loads its data from (found at runtime)
+JOB_API_RE = re.compile(r'/api/.+/jobs/(\d+)')
+# Candidate keys for each field of the job API payload, tried in order
+API_FIELD_KEYS = {
+    'title': ('title', 'jobTitle', 'name'),
+    'company': ('organization', 'organizationName', 'companyName', 'company', 'employer'),
+    'location': ('location', 'locationName', 'city', 'address'),
+    'description': ('description', 'jobDescription', 'body'),
+    'employment_type': ('employmentType', 'jobType', 'type'),
+    'industry': ('industry', 'industryName', 'sector'),
+    'closing_date': ('closingDate', 'deadline', 'expiresAt'),
+    'company_logo_url': ('logo', 'logoUrl', 'companyLogo', 'thumbnail', 'image'),
+    'requirements': ('requirements', 'qualifications', 'profile'),
+    'posted_date': ('postedDate', 'publishedAt', 'createdAt'),
+    'job_function': ('jobFunction', 'function', 'category'),
+    'image_url': ('imageUrl', 'coverImage', 'banner'),
+    'added_by_name': ('addedByName', 'addedBy', 'author', 'createdBy'),
+    'added_by_company': ('addedByCompany', 'addedByDescription', 'authorDescription'),
+}
+
+# Angular element IDs of the job page and the field each one holds
+ID_FIELDS = {
+    'jobPageJobTitle': 'title',
+    'jobPageOrganization_0': 'company',
+    'jobPageOrganization_2': 'employment_type',
+    'jobPageJobFunction_0': 'location',
+    'jobPageJobFunction_2': 'industry',
+    'jobPageDescription': 'description',
+}
+ID_FIELDS_SELECTOR = '[id^="jobPage"]'
+
+# Closing date sits in a bare text node, so it is cheaper to read from the raw HTML
+CLOSING_DATE_RE = re.compile(r'Closing date for applications:[^<]*')
+ADDED_BY_SELECTOR = 'h4.gw-section-caption:lexbor-contains("Added by")'
+
+# CSS selectors tried in order for each job field when the ID lookup misses
+TITLE_SELECTORS = (
+    '#jobPageJobTitle',
+    'h2#jobPageJobTitle',
+    'h1.job-title',
+    '.job-header h1',
+    '.job-details h1',
+    'h1',
+    'h2',
+    '.title'
+)
+COMPANY_SELECTORS = (
+    '#jobPageOrganization_0',
+    'p#jobPageOrganization_0',
+    '.company-name',
+    '.job-company',
+    '.employer',
+    '.company'
+)
+# Angular renders the employment type in the "job function" slot
+LOCATION_SELECTORS = (
+    '#jobPageJobFunction_0',
+    'p#jobPageJobFunction_0',
+    '.job-location',
+    '.location',
+    '.job-address'
+)
+DESCRIPTION_SELECTORS = (
+    '#jobPageDescription',
+    'div#jobPageDescription',
+    '.job-description',
+    '.description',
+    '.job-content',
+    '.content'
+)
+REQUIREMENTS_SELECTORS = (
+    '.job-requirements',
+    '.requirements',
+    '.job-qualifications',
+    '.qualifications'
+)
+DATE_SELECTORS = (
+    '.posted-date',
+    '.job-date',
+    '.publication-date'
+)
+IMAGE_SELECTORS = (
+    '.job-image img',
+    '.company-logo img',
+    '.job-header img'
+)
+COMPANY_LOGO_SELECTORS = (
+    '.gw-company-logo img',
+    '.company-logo-position'
+)
+EMPLOYMENT_TYPE_SELECTORS = (
+    '#jobPageOrganization_2',
+    'p#jobPageOrganization_2'
+)
+INDUSTRY_SELECTORS = (
+    '#jobPageJobFunction_2',
+    'p#jobPageJobFunction_2'
+)
+ACTUAL_LOCATION_SELECTORS = (
+    '.location-address',
+    '.location-icon-text'
+)
+
+# urllib3 keeps a single connection per host by default, so overlapping
+# WebDriver commands would queue on it and reconnect when it overflows
+WEBDRIVER_POOL_MAXSIZE = 20
+
+
+def _patch_webdriver_connection_pool() -> None:
+    """Make Selenium's urllib3 pool manager hold more connections per host"""
+    original = getattr(RemoteConnection, '_get_connection_manager', None)
+    if original is None or getattr(original, '_pool_patched', False):
+        return
+
+    def _get_connection_manager(self):
+        manager = original(self)
+        manager.connection_pool_kw.update(
+            maxsize=WEBDRIVER_POOL_MAXSIZE, block=False)
+        return manager
+
+    _get_connection_manager._pool_patched = True
+    RemoteConnection._get_connection_manager = _get_connection_manager
+
+
+_patch_webdriver_connection_pool()
+
+# Chrome instances are pooled per process (keyed by their command-line
+# arguments) so repeated scraper runs skip browser startup. Up to
+# DRIVER_POOL_SIZE idle drivers are kept warm, MAX_DRIVERS may be live.
+DRIVER_POOL_SIZE = 2
+MAX_DRIVERS = 4
+_DRIVER_POOLS: Dict[Tuple[str, ...], "queue.Queue[webdriver.Chrome]"] = {}
+_LIVE_DRIVERS: List[webdriver.Chrome] = []
+_DRIVER_LOCK = threading.Lock()
+# Notified whenever a driver goes back to any pool or is quit
+_DRIVER_RELEASED = threading.Condition(_DRIVER_LOCK)
+
+
+def _pool_for(options: Options) -> "queue.Queue[webdriver.Chrome]":
+    """Get the idle-driver queue for a set of Chrome options"""
+    key = tuple(options.arguments)
+    with _DRIVER_LOCK:
+        return _DRIVER_POOLS.setdefault(key, queue.Queue())
+
 
-@dataclass
+def acquire_driver(options: Options, block: bool = True) -> Optional[webdriver.Chrome]:
+    """Take an idle driver from the pool, starting a new one if allowed
+
+    With block=False, returns None instead of waiting when every driver is busy.
+    """
+    pool = _pool_for(options)
+    idle = None
+    with _DRIVER_RELEASED:
+        while True:
+            try:
+                driver = pool.get_nowait()
+                logger.info("♻️ Reusing pooled Chrome driver")
+                return driver
+            except queue.Empty:
+                pass
+
+            if len(_LIVE_DRIVERS) < MAX_DRIVERS:
+                break
+            # Drivers idling under other options still count against the cap,
+            # so retire one of them to make room
+            idle = next((other.get_nowait() for other in _DRIVER_POOLS.values()
+                         if other is not pool and not other.empty()), None)
+            if idle is not None:
+                _LIVE_DRIVERS.remove(idle)
+                break
+            if not block:
+                return None
+            # Every driver is in use - wait for one to be released or quit
+            _DRIVER_RELEASED.wait()
+
+    if idle is not None:
+        _quit_driver(idle)
+    driver = webdriver.Chrome(options=options)
+    with _DRIVER_LOCK:
+        _LIVE_DRIVERS.append(driver)
+    return driver
+
+
+def _quit_driver(driver: webdriver.Chrome) -> None:
+    """Quit a driver and forget about it"""
+    with _DRIVER_RELEASED:
+        if driver in _LIVE_DRIVERS:
+            _LIVE_DRIVERS.remove(driver)
+        _DRIVER_RELEASED.notify_all()
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"Error quitting Chrome driver: {e}")
+
+
+def release_driver(driver: webdriver.Chrome, options: Options) -> None:
+    """Return a driver to the pool with a clean session, or quit it"""
+    pool = _pool_for(options)
+    if pool.qsize() >= DRIVER_POOL_SIZE:
+        _quit_driver(driver)
+        return
+
+    try:
+        # Drop the login session so the next user starts from a clean browser
+        driver.delete_all_cookies()
+        driver.execute_script(
+            "window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException as e:
+        logger.warning(f"Discarding broken Chrome driver: {e}")
+        _quit_driver(driver)
+        return
+
+    with _DRIVER_RELEASED:
+        pool.put(driver)
+        _DRIVER_RELEASED.notify_all()
+
+
+def shutdown_driver_pool() -> None:
+    """Quit every driver started by this process"""
+    with _DRIVER_LOCK:
+        drivers = list(_LIVE_DRIVERS)
+        _DRIVER_POOLS.clear()
+    for driver in drivers:
+        _quit_driver(driver)
+
+
+atexit.register(shutdown_driver_pool)
+
+
+# Placeholder values that mean a job field was not found on the page
+UNKNOWN_TITLES = frozenset({"", "unknown", "no title", "unknown title"})
+UNKNOWN_COMPANIES = frozenset({"", "unknown", "unknown company", "no company"})
+UNKNOWN_DESCRIPTIONS = frozenset(
+    {"", "no description available", "no description", "unknown description"})
+
+
+@dataclass(slots=True)
 class JobPosting:
     """Data structure for a job posting"""
     job_id: int
@@ -95,6 +388,76 @@ class JobPosting:
             self.scraped_at = datetime.now().isoformat()
 
 
+def _bloom_hash(job_id: int) -> int:
+    """Stable 128-bit hash so the bloom filter can be saved and reloaded"""
+    digest = hashlib.blake2b(str(job_id).encode(), digest_size=16).digest()
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def _last_index_id(index_file: str) -> int:
+    """Read the highest job ID from the end of the sorted index file"""
+    with open(index_file, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - 64))
+        return int(f.read().split()[-1])
+
+
+def _read_index_tail(index_file: str, floor: int, block_size: int = 64 * 1024) -> set:
+    """Read the job IDs >= floor from the end of the sorted index file"""
+    ids = set()
+    with open(index_file, 'rb') as f:
+        end = f.seek(0, os.SEEK_END)
+        carry = b''
+        while end > 0:
+            start = max(0, end - block_size)
+            f.seek(start)
+            chunk = f.read(end - start) + carry
+            lines = chunk.split(b'\n')
+            # The first line may be cut in half unless we reached the start
+            carry = lines.pop(0) if start > 0 else b''
+            block_ids = [int(line) for line in lines if line.strip()]
+            ids.update(job_id for job_id in block_ids if job_id >= floor)
+            if any(job_id < floor for job_id in block_ids):
+                break
+            end = start
+    return ids
+
+
+class JobIdFilter:
+    """Set-like view of archived job IDs backed by a bloom filter
+
+    Bloom hits can be false positives, so they are confirmed against the exact
+    IDs near the resume point (the only ones a forward scan checks). The full
+    index is only read if an older ID ever needs confirming.
+    """
+
+    def __init__(self, bloom, recent_ids: set, floor: int, index_file: str):
+        self.bloom = bloom
+        self.recent_ids = recent_ids
+        self.floor = floor
+        self.index_file = index_file
+        self.max_id = max(recent_ids) if recent_ids else _last_index_id(index_file)
+        self._all_ids: Optional[set] = None
+
+    def __contains__(self, job_id: int) -> bool:
+        if job_id not in self.bloom:
+            return False
+        if job_id >= self.floor:
+            return job_id in self.recent_ids
+        if self._all_ids is None:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                self._all_ids = {int(line) for line in f if line.strip()}
+        return job_id in self._all_ids or job_id in self.recent_ids
+
+    def add(self, job_id: int) -> None:
+        self.bloom.add(job_id)
+        self.recent_ids.add(job_id)
+        self.max_id = max(self.max_id, job_id)
+
+    def __len__(self) -> int:
+        return round(self.bloom.approx_items)
+
+
 class EspritJobScraper:
     """Main scraper class for Esprit Connect jobs"""
 
@@ -103,9 +466,29 @@ class EspritJobScraper:
         self.initial_job_id = 795
         self.state_file = state_file
         self.current_job_id = self.load_last_job_id()
+        # Last job ID recorded in the state file, reported in summary.json
+        self.session_start_job_id = self.current_job_id
         self.base_url = "https://espritconnect.com"
         self.jobs_scraped: List[JobPosting] = []
+        # How many of jobs_scraped have already been written by save_results
+        self._saved_job_count = 0
+
+        # Keep-alive session for one-off page fetches outside the async batches
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_REQUESTS,
+                              pool_maxsize=MAX_CONCURRENT_REQUESTS * 2,
+                              pool_block=False)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['Connection'] = 'keep-alive'
+        # Whether plain HTTP serves rendered job pages (decided after login)
+        self.use_http = True
+        # URL template of the job JSON API, e.g. ".../api/v1/jobs/{job_id}"
+        self.api_url_template: Optional[str] = None
+        self._api_discovery_done = False
+
+        # Bloom filter built from existing_job_ids once the archive is large
+        self._id_bloom = None
 
         # Load existing job IDs for duplicate detection (EXTRA SAFETY)
         self.existing_job_ids = self.load_existing_job_ids()
@@ -124,16 +507,29 @@ class EspritJobScraper:
         self.chrome_options.add_argument('--disable-dev-shm-usage')
         self.chrome_options.add_argument('--disable-gpu')
         self.chrome_options.add_argument('--window-size=1920,1080')
+        # Network events let us discover the JSON API behind the job pages
+        self.chrome_options.set_capability(
+            'goog:loggingPrefs', {'performance': 'ALL'})
+        # Skip image decoding; logo URLs are still read from the DOM attributes
+        self.chrome_options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2})
 
         self.driver = None
         self.wait = None
+        self._semaphore = None
+
+        # Second browser that loads the next job while the current one is parsed
+        self.prefetch_driver = None
+        self._prefetch_disabled = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._prefetched: Dict[int, Future] = {}
 
     def load_last_job_id(self) -> int:
         """Load the last scraped job ID from state file, or return initial ID"""
         try:
             if os.path.exists(self.state_file):
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    state = orjson.loads(f.read())
                     last_id = state.get('last_job_id', self.initial_job_id)
                     logger.info(
                         f"Resuming from job ID {last_id} (loaded from {self.state_file})")
@@ -147,12 +543,20 @@ class EspritJobScraper:
                 f"Error loading state file: {e}, starting from initial job ID {self.initial_job_id}")
             return self.initial_job_id
 
-    def load_existing_job_ids(self) -> set:
+    def load_existing_job_ids(self) -> Union[set, JobIdFilter]:
         """Load existing job IDs from data files for duplicate detection"""
+        self._drop_stale_caches("data")
+        bloom_ids = self._load_job_id_bloom("data")
+        if bloom_ids is not None:
+            logger.info(
+                f"🛡️ Duplicate detection active - loaded bloom filter for ~{len(bloom_ids)} existing jobs")
+            return bloom_ids
+
         existing_ids = set()
 
         # Check multiple possible locations for existing job data
         data_files = [
+            "data/jobs_raw.ndjson",
             "data/jobs_raw.json",
             "jobs_raw.json"
         ]
@@ -160,12 +564,11 @@ class EspritJobScraper:
         for data_file in data_files:
             if os.path.exists(data_file):
                 try:
-                    with open(data_file, 'r', encoding='utf-8') as f:
-                        jobs = json.load(f)
+                    job_ids = self._load_job_index(data_file)
+                    if job_ids is None:
+                        job_ids = self._stream_job_ids(data_file)
 
-                    if jobs:
-                        job_ids = {job['job_id']
-                                   for job in jobs if 'job_id' in job}
+                    if job_ids:
                         existing_ids.update(job_ids)
                         logger.info(
                             f"🔍 Loaded {len(job_ids)} existing job IDs from {data_file}")
@@ -183,6 +586,85 @@ class EspritJobScraper:
 
         return existing_ids
 
+    def _drop_stale_caches(self, data_dir: str) -> None:
+        """Remove local caches that are older than the committed jobs file
+
+        jobs_raw.json is written before the caches on every save, so a cache
+        older than it missed jobs that came from elsewhere (e.g. a git pull of
+        the CI's results). They are rebuilt from jobs_raw.json on the next save.
+        """
+        raw_json_file = os.path.join(data_dir, "jobs_raw.json")
+        if not os.path.exists(raw_json_file):
+            return
+
+        raw_json_mtime = os.path.getmtime(raw_json_file)
+        for cache_file in (JOBS_ARCHIVE_FILE, JOBS_INDEX_FILE, JOBS_BLOOM_FILE):
+            cache_path = os.path.join(data_dir, cache_file)
+            if os.path.exists(cache_path) and os.path.getmtime(cache_path) < raw_json_mtime:
+                logger.info(f"🧹 {cache_path} is older than {raw_json_file} - rebuilding it")
+                os.remove(cache_path)
+
+    def _stream_job_ids(self, data_file: str) -> set:
+        """Stream just the job_id values out of a JSON or NDJSON jobs file"""
+        with open(data_file, 'rb') as f:
+            if data_file.endswith('.ndjson'):
+                return set(ijson.items(f, 'job_id', multiple_values=True))
+            return set(ijson.items(f, 'item.job_id'))
+
+    def _load_job_index(self, data_file: str) -> Optional[set]:
+        """Load job IDs from the index next to a jobs file, if it is up to date"""
+        index_file = os.path.join(os.path.dirname(data_file), JOBS_INDEX_FILE)
+        if not os.path.exists(index_file) or \
+                os.path.getmtime(index_file) < os.path.getmtime(data_file):
+            return None
+
+        with open(index_file, 'r', encoding='utf-8') as f:
+            return {int(line) for line in f if line.strip()}
+
+    def _load_job_id_bloom(self, data_dir: str) -> Optional[JobIdFilter]:
+        """Load the saved bloom filter if it is newer than the job index"""
+        bloom_file = os.path.join(data_dir, JOBS_BLOOM_FILE)
+        index_file = os.path.join(data_dir, JOBS_INDEX_FILE)
+        if Bloom is None or not os.path.exists(bloom_file) or not os.path.exists(index_file):
+            return None
+        if os.path.getmtime(bloom_file) < os.path.getmtime(index_file):
+            return None
+        for data_file in (JOBS_ARCHIVE_FILE, "jobs_raw.json"):
+            data_path = os.path.join(data_dir, data_file)
+            if os.path.exists(data_path) and \
+                    os.path.getmtime(index_file) < os.path.getmtime(data_path):
+                return None
+
+        try:
+            with open(bloom_file, 'rb') as f:
+                bloom = Bloom.load_bytes(f.read(), _bloom_hash)
+            floor = self.session_start_job_id - RECENT_ID_WINDOW
+            return JobIdFilter(bloom, _read_index_tail(index_file, floor), floor, index_file)
+        except Exception as e:
+            logger.warning(f"Error loading bloom filter {bloom_file}: {e}")
+            return None
+
+    def _save_job_id_bloom(self, data_dir: str, new_job_ids: List[int]) -> None:
+        """Persist a bloom filter of the archived job IDs for large archives"""
+        bloom_file = os.path.join(data_dir, JOBS_BLOOM_FILE)
+        job_ids = self.existing_job_ids
+        if isinstance(job_ids, JobIdFilter):
+            bloom = job_ids.bloom  # Already holds every ID added this run
+        elif Bloom is None or len(job_ids) < BLOOM_MIN_JOBS:
+            if os.path.exists(bloom_file):
+                os.remove(bloom_file)
+            return
+        elif self._id_bloom is None:
+            # Built from the full set once per run, then only extended
+            bloom = self._id_bloom = Bloom(max(BLOOM_CAPACITY, 2 * len(job_ids)),
+                                           BLOOM_ERROR_RATE, _bloom_hash)
+            bloom.update(job_ids)
+        else:
+            bloom = self._id_bloom
+            bloom.update(new_job_ids)
+        with open(bloom_file, 'wb') as f:
+            f.write(bloom.save_bytes())
+
     def save_last_job_id(self, job_id: int) -> None:
         """Save the last processed job ID to state file"""
         try:
@@ -195,15 +677,15 @@ class EspritJobScraper:
             # If state file exists, preserve run count
             if os.path.exists(self.state_file):
                 try:
-                    with open(self.state_file, 'r') as f:
-                        existing_state = json.load(f)
+                    with open(self.state_file, 'rb') as f:
+                        existing_state = orjson.loads(f.read())
                         state['total_runs'] = existing_state.get(
                             'total_runs', 0) + 1
                 except Exception:
                     pass
 
-            with open(self.state_file, 'w') as f:
-                json.dump(state, f, indent=2)
+            with open(self.state_file, 'wb') as f:
+                f.write(orjson.dumps(state, option=orjson.OPT_INDENT_2))
 
             logger.info(
                 f"Saved state: next run will start from job ID {job_id + 1}")
@@ -212,15 +694,31 @@ class EspritJobScraper:
 
     def __enter__(self):
         """Context manager entry"""
-        self.driver = webdriver.Chrome(options=self.chrome_options)
-        self.driver.implicitly_wait(10)
+        self.driver = acquire_driver(self.chrome_options)
+        self._block_heavy_resources(self.driver)
+        # Explicit waits only: an implicit wait would stack on top of every
+        # WebDriverWait poll that has to fail before it times out
+        self.driver.implicitly_wait(0)
         self.wait = WebDriverWait(self.driver, 20)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
+        if self.prefetch_driver:
+            release_driver(self.prefetch_driver, self.chrome_options)
+            self.prefetch_driver = None
         if self.driver:
-            self.driver.quit()
+            release_driver(self.driver, self.chrome_options)
+            self.driver = None
+
+    def _block_heavy_resources(self, driver: webdriver.Chrome) -> None:
+        """Stop Chrome from downloading images, fonts and analytics scripts"""
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs',
+                                   {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not block page resources: {e}")
 
     def login(self) -> bool:
         """Authenticate to Esprit Connect"""
@@ -303,245 +801,502 @@ class EspritJobScraper:
             logger.error(f"❌ Login error: {e}")
             return False
 
-    def is_redirected_to_home(self) -> bool:
+    def _is_home_url(self, url: str) -> bool:
+        """Check if a URL is the home page rather than a job page"""
+        return (
+            url.endswith('/feed') or
+            url.endswith('/') or
+            url.endswith('/jobs') or  # Redirected to jobs list
+            '/jobs/' not in url or
+            url == self.base_url or
+            url == f"{self.base_url}/" or
+            url == f"{self.base_url}/feed"
+        )
+
+    def is_redirected_to_home(self, driver: Optional[webdriver.Chrome] = None) -> bool:
         """Check if we've been redirected to home page (indicating non-existent job)"""
-        current_url = self.driver.current_url
+        current_url = (driver or self.driver).current_url
 
         # More robust redirect detection
-        redirected = (
-            current_url.endswith('/feed') or
-            current_url.endswith('/') or
-            current_url.endswith('/jobs') or  # Redirected to jobs list
-            '/jobs/' not in current_url or
-            current_url == self.base_url or
-            current_url == f"{self.base_url}/" or
-            current_url == f"{self.base_url}/feed"
-        )
+        redirected = self._is_home_url(current_url)
 
         if redirected:
             logger.info(f"Detected redirect: {current_url}")
 
         return redirected
 
-    def extract_job_data(self, job_id: int) -> Optional[Union[JobPosting, str]]:
-        """Extract job data from a job page"""
-        try:
-            job_url = f"{self.base_url}/jobs/{job_id}"
-            logger.info(f"Scraping job {job_id}: {job_url}")
+    def _build_http_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session that reuses the browser's login cookies"""
+        cookie_jar = aiohttp.CookieJar()
+        for cookie in self.driver.get_cookies():
+            cookie_jar.update_cookies(
+                {cookie['name']: cookie['value']}, URL(self.base_url))
+
+        user_agent = self.driver.execute_script("return navigator.userAgent")
+        return aiohttp.ClientSession(
+            cookie_jar=cookie_jar,
+            connector=aiohttp.TCPConnector(
+                limit_per_host=MAX_CONCURRENT_REQUESTS, keepalive_timeout=60),
+            headers={'User-Agent': user_agent},
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
 
-            self.driver.get(job_url)
-            time.sleep(2)  # Allow page to load
+    def _sync_session_cookies(self) -> None:
+        """Copy the browser's login cookies into the requests session"""
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(
+                cookie['name'], cookie['value'],
+                domain=cookie.get('domain', ''), path=cookie.get('path', '/'))
+        self.session.headers['User-Agent'] = self.driver.execute_script(
+            "return navigator.userAgent")
+
+    def _fetch_html(self, job_id: int) -> Optional[str]:
+        """Fetch a job page over the keep-alive session
+
+        Returns None when the server redirects to the home page.
+        """
+        job_url = f"{self.base_url}/jobs/{job_id}"
+        response = self.session.get(job_url, allow_redirects=False, timeout=30)
+        if response.status_code in REDIRECT_STATUSES:
+            location = urljoin(job_url, response.headers.get('Location', ''))
+            if self._is_home_url(location):
+                return None
+        response.raise_for_status()
+        return response.text
+
+    def _http_serves_job_pages(self) -> bool:
+        """Check on known jobs whether plain HTTP returns rendered job pages
+
+        A known job may have been removed since it was archived, so a redirect
+        only means that job is gone: the next most recent one is probed. If
+        every probe redirects, the login most likely doesn't carry over to plain
+        HTTP (where a redirect counts as a missing job), so the browser is used.
+        """
+        if not self.existing_job_ids:
+            return True
+
+        if isinstance(self.existing_job_ids, JobIdFilter):
+            known_ids = self.existing_job_ids.recent_ids or {self.existing_job_ids.max_id}
+        else:
+            known_ids = self.existing_job_ids
+        self._sync_session_cookies()
+        for known_job_id in heapq.nlargest(HTTP_CHECK_PROBES, known_ids):
+            try:
+                html = self._fetch_html(known_job_id)
+            except requests.RequestException as e:
+                logger.warning(f"HTTP check on job {known_job_id} failed: {e}")
+                return False
 
-            # Check if redirected (job doesn't exist)
-            if self.is_redirected_to_home():
+            if html is None:
                 logger.info(
-                    f"Job {job_id} doesn't exist - redirected to home page")
-                # Wait 3 seconds to ensure redirect is complete
+                    f"Job {known_job_id} redirected during the HTTP check - trying an older job")
+                continue
+            if JOB_PAGE_MARKER not in html:
+                logger.info(
+                    f"Job {known_job_id} is not served as rendered HTML - using the browser for all jobs")
+                return False
+            break
+        else:
+            logger.info(
+                "Every known job redirected over HTTP - using the browser for all jobs")
+            return False
+
+        logger.info("⚡ Job pages are server-rendered - fetching over HTTP")
+        return True
+
+    async def extract_job_data(self, session: aiohttp.ClientSession, job_id: int) -> Optional[Union[JobPosting, str]]:
+        """Fetch a job page over HTTP and extract its data
+
+        Returns "NEEDS_BROWSER" when the page has to be rendered by Chrome
+        (client-side rendered markup, unexpected redirect or network error).
+        """
+        job_url = f"{self.base_url}/jobs/{job_id}"
+        try:
+            async with self._semaphore:
+                logger.info(f"Scraping job {job_id}: {job_url}")
+                if self.api_url_template:
+                    return await self._fetch_job_from_api(session, job_id)
+
+                async with session.get(job_url, allow_redirects=False) as response:
+                    if response.status in REDIRECT_STATUSES:
+                        location = urljoin(
+                            job_url, response.headers.get('Location', ''))
+                        if self._is_home_url(location):
+                            logger.info(
+                                f"Job {job_id} doesn't exist - redirected to {location}")
+                            return None
+                        return "NEEDS_BROWSER"
+
+                    if response.status != 200:
+                        return "NEEDS_BROWSER"
+                    html = await response.text()
+
+            if JOB_PAGE_MARKER not in html:
+                return "NEEDS_BROWSER"
+
+            return self._parse_job_page(job_id, job_url, html)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(
+                f"HTTP fetch failed for job {job_id}: {e} - falling back to browser")
+            return "NEEDS_BROWSER"
+        except Exception as e:
+            logger.error(f"❌ Error scraping job {job_id}: {e}")
+            return None
+
+    async def _fetch_job_from_api(self, session: aiohttp.ClientSession, job_id: int) -> Optional[Union[JobPosting, str]]:
+        """Fetch a job from the JSON API instead of rendering its page"""
+        api_url = self.api_url_template.format(job_id=job_id)
+        async with session.get(api_url, allow_redirects=False,
+                               headers={'Accept': 'application/json'}) as response:
+            if response.status in (404, 410):
                 logger.info(
-                    "Waiting 3 seconds to ensure redirect is complete...")
-                time.sleep(3)
+                    f"Job {job_id} doesn't exist - API returned {response.status}")
                 return None
+            if response.status in (401, 403):
+                logger.warning(
+                    "Job API rejected the session - falling back to page scraping")
+                self.api_url_template = None
+                return "NEEDS_BROWSER"
+            if response.status != 200:
+                return "NEEDS_BROWSER"
+            payload = orjson.loads(await response.read())
+
+        return self._job_from_api(job_id, payload) or "NEEDS_BROWSER"
+
+    def _api_value(self, payload: dict, keys: Tuple[str, ...]) -> Optional[str]:
+        """Return the first non-empty value among candidate payload keys"""
+        for key in keys:
+            value = payload.get(key)
+            if isinstance(value, dict):
+                value = value.get('name') or value.get('title')
+            if isinstance(value, (str, int, float)) and str(value).strip():
+                return str(value).strip()
+        return None
 
-            # Extract job information
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-
-            # Try to find job title - Updated for Angular components
-            title_selectors = [
-                '#jobPageJobTitle',  # Angular-specific ID
-                'h2#jobPageJobTitle',
-                'h1.job-title',
-                '.job-header h1',
-                '.job-details h1',
-                'h1',
-                'h2',
-                '.title'
-            ]
-            title = self._extract_text_by_selectors(
-                soup, title_selectors, "Unknown Title")
-
-            # Try to find company - Updated for Angular components
-            company_selectors = [
-                '#jobPageOrganization_0',  # Angular-specific ID
-                'p#jobPageOrganization_0',
-                '.company-name',
-                '.job-company',
-                '.employer',
-                '.company'
-            ]
-            company = self._extract_text_by_selectors(
-                soup, company_selectors, "Unknown Company")
-
-            # Try to find location/employment type - Updated for Angular components
-            location_selectors = [
-                # Angular-specific ID (employment type)
-                '#jobPageJobFunction_0',
-                'p#jobPageJobFunction_0',
-                '.job-location',
-                '.location',
-                '.job-address'
-            ]
-            location = self._extract_text_by_selectors(
-                soup, location_selectors, "Unknown Location")
-
-            # Try to find description - Updated for Angular components
-            description_selectors = [
-                '#jobPageDescription',  # Angular-specific ID
-                'div#jobPageDescription',
-                '.job-description',
-                '.description',
-                '.job-content',
-                '.content'
-            ]
-            description = self._extract_text_by_selectors(
-                soup, description_selectors, "No description available")
-
-            # Try to find requirements
-            requirements_selectors = [
-                '.job-requirements',
-                '.requirements',
-                '.job-qualifications',
-                '.qualifications'
-            ]
-            requirements = self._extract_text_by_selectors(
-                soup, requirements_selectors, "No requirements specified")
-
-            # Try to find posted date
-            date_selectors = [
-                '.posted-date',
-                '.job-date',
-                '.publication-date'
-            ]
-            posted_date = self._extract_text_by_selectors(
-                soup, date_selectors, "Unknown Date")
-
-            # Try to find image
-            image_selectors = [
-                '.job-image img',
-                '.company-logo img',
-                '.job-header img'
-            ]
-            image_url = self._extract_image_url(soup, image_selectors)
-
-            # Extract new fields for improved feed
-
-            # Company logo
-            company_logo_selectors = [
-                '.gw-company-logo img',
-                '.company-logo-position'
-            ]
-            company_logo_url = self._extract_image_url(
-                soup, company_logo_selectors)
-
-            # Employment type (different from job function)
-            employment_type_selectors = [
-                '#jobPageOrganization_2',  # Angular-specific ID for employment type
-                'p#jobPageOrganization_2'
-            ]
-            employment_type = self._extract_text_by_selectors(
-                soup, employment_type_selectors, None)
-
-            # Industry
-            industry_selectors = [
-                '#jobPageJobFunction_2',  # Angular-specific ID for industry
-                'p#jobPageJobFunction_2'
-            ]
-            industry = self._extract_text_by_selectors(
-                soup, industry_selectors, None)
-
-            # Actual location (from location text)
-            actual_location_selectors = [
-                '.location-address',
-                '.location-icon-text'
-            ]
-            actual_location = self._extract_text_by_selectors(
-                soup, actual_location_selectors, None)
-
-            # Closing date
-            closing_date = None
-            try:
-                # Look for "Closing date for applications:" text
-                closing_text = soup.find(
-                    text=lambda t: t and "Closing date for applications:" in t)
-                if closing_text:
-                    closing_date = closing_text.strip()
-            except:
-                pass
+    def _job_from_api(self, job_id: int, payload) -> Optional[JobPosting]:
+        """Map a job API payload onto a JobPosting, or None if it doesn't fit"""
+        if isinstance(payload, dict) and isinstance(payload.get('data'), dict):
+            payload = payload['data']
+        if not isinstance(payload, dict):
+            return None
+
+        values = {field: self._api_value(payload, keys)
+                  for field, keys in API_FIELD_KEYS.items()}
+        if not values['title']:
+            return None
+
+        description = values['description'] or "No description available"
+        if '<' in description:
+            description = HTMLParser(description).text(strip=True)
+        requirements = values['requirements'] or "No requirements specified"
+        if '<' in requirements:
+            requirements = HTMLParser(requirements).text(strip=True)
+
+        logo = values['company_logo_url']
+        image = values['image_url']
+        closing = values['closing_date']
+        job = JobPosting(
+            job_id=job_id,
+            title=values['title'],
+            company=values['company'] or "Unknown Company",
+            location=values['location'] or "Unknown Location",
+            description=description[:1000],
+            requirements=requirements[:500],
+            posted_date=values['posted_date'] or "Unknown Date",
+            url=f"{self.base_url}/jobs/{job_id}",
+            image_url=urljoin(self.base_url, image) if image else None,
+            company_logo_url=urljoin(self.base_url, logo) if logo else None,
+            employment_type=values['employment_type'],
+            industry=values['industry'],
+            job_function=values['job_function'],
+            closing_date=f"Closing date for applications: {closing}" if closing else None,
+            added_by_name=values['added_by_name'],
+            added_by_company=values['added_by_company']
+        )
+
+        # Unknown payload layout - let the page scraper handle this job
+        if self._is_empty_job(job):
+            return None
+
+        logger.info(f"✅ Successfully fetched job {job_id} from API: {job.title}")
+        return job
+
+    def _discover_job_api(self, driver: webdriver.Chrome, job: JobPosting) -> None:
+        """Find the JSON endpoint a rendered job page loaded in Chrome's network log
+
+        The endpoint is only used if its payload maps onto the same job the
+        page scraper just extracted, so no field is lost on the API path.
+        """
+        self._api_discovery_done = True
+        try:
+            entries = driver.get_log('performance')
+        except WebDriverException as e:
+            logger.info(f"Performance log unavailable: {e}")
+            return
+
+        for entry in entries:
+            message = orjson.loads(entry['message']).get('message', {})
+            if message.get('method') != 'Network.responseReceived':
+                continue
+            url = message['params']['response']['url']
+            match = JOB_API_RE.search(url)
+            if match and match.group(1) == str(job.job_id):
+                template = url[:match.start(1)] + '{job_id}' + url[match.end(1):]
+                if self._api_matches_page(template, job):
+                    self.api_url_template = template
+                    logger.info(f"🔌 Discovered job API: {template}")
+                return
+
+    def _api_matches_page(self, template: str, job: JobPosting) -> bool:
+        """Check that the job API reproduces every field of a scraped job page"""
+        try:
+            self._sync_session_cookies()
+            response = self.session.get(
+                template.format(job_id=job.job_id), allow_redirects=False,
+                headers={'Accept': 'application/json'}, timeout=30)
+            if response.status_code != 200:
+                logger.info(
+                    f"Job API returned {response.status_code} - keeping page scraping")
+                return False
+            api_job = self._job_from_api(job.job_id, orjson.loads(response.content))
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            logger.info(f"Could not check job API: {e} - keeping page scraping")
+            return False
+
+        if api_job is None:
+            logger.info("Job API payload has an unknown layout - keeping page scraping")
+            return False
+        mismatched = [field.name for field in fields(JobPosting)
+                      if field.name != 'scraped_at'
+                      and getattr(api_job, field.name) != getattr(job, field.name)]
+        if mismatched:
+            logger.info(
+                f"Job API doesn't match the page ({', '.join(mismatched)}) - keeping page scraping")
+            return False
+        return True
+
+    def _start_prefetch_driver(self) -> None:
+        """Open a second browser that shares the login session"""
+        driver = acquire_driver(self.chrome_options, block=False)
+        if driver is None:
+            logger.info("No spare Chrome driver - rendering jobs one at a time")
+            self._prefetch_disabled = True
+            return
+
+        try:
+            self._block_heavy_resources(driver)
+            driver.implicitly_wait(0)
+            driver.get(f"{self.base_url}/")
+            for cookie in self.driver.get_cookies():
+                driver.add_cookie({key: cookie[key] for key in
+                                   ('name', 'value', 'path', 'domain', 'secure', 'expiry')
+                                   if key in cookie})
+            storage = self.driver.execute_script(
+                "return JSON.stringify(window.localStorage);")
+            driver.execute_script(
+                "const items = JSON.parse(arguments[0]);"
+                "for (const key in items) window.localStorage.setItem(key, items[key]);",
+                storage)
+        except Exception as e:
+            logger.warning(f"Could not share session with prefetch driver: {e}")
+            release_driver(driver, self.chrome_options)
+            self._prefetch_disabled = True
+            return
+
+        self.prefetch_driver = driver
+        logger.info("⏩ Prefetching the next job in a second browser")
+
+    def _submit_page_render(self, job_id: int) -> Future:
+        """Start rendering a job, alternating between the two drivers"""
+        driver = self.driver
+        if self.prefetch_driver and job_id % 2:
+            driver = self.prefetch_driver
+        return self._executor.submit(self.extract_job_data_with_driver, job_id, driver)
+
+    async def _extract_with_browser(self, job_id: int, prefetch_next: bool) -> Optional[Union[JobPosting, str]]:
+        """Render a job in Chrome while the next job loads in the other browser"""
+        if prefetch_next and self.prefetch_driver is None and not self._prefetch_disabled:
+            self._start_prefetch_driver()
+
+        future = self._prefetched.pop(job_id, None) or self._submit_page_render(job_id)
+        if prefetch_next and self.prefetch_driver and job_id + 1 not in self._prefetched:
+            self._prefetched[job_id + 1] = self._submit_page_render(job_id + 1)
+
+        job = await asyncio.wrap_future(future)
+
+        if job in (None, "EMPTY_JOB_STOP") and self.prefetch_driver and job_id % 2:
+            # Confirm a missing or empty job (either can end the run) in the
+            # browser that logged in, once it has finished prefetching the next job
+            if job_id + 1 in self._prefetched:
+                await asyncio.wrap_future(self._prefetched[job_id + 1])
+            prefetched_job = job
+            job = await asyncio.wrap_future(self._executor.submit(
+                self.extract_job_data_with_driver, job_id))
+            if job != prefetched_job:
+                logger.warning(
+                    "Prefetch browser is not logged in - disabling prefetching")
+                self._stop_prefetching()
+                self._prefetch_disabled = True
 
-            # Added by information
-            added_by_name = None
-            added_by_company = None
+        # Look for the job API on this thread, in the logged-in browser, and only
+        # when that browser rendered this job and has no other render in flight
+        if isinstance(job, JobPosting) and not self._api_discovery_done and \
+                not (self.prefetch_driver and job_id % 2):
+            self._discover_job_api(self.driver, job)
+
+        return job
+
+    def _stop_prefetching(self) -> None:
+        """Wait for in-flight prefetches and hand the second browser back"""
+        for future in self._prefetched.values():
             try:
-                # Find the "Added by" section
-                added_by_section = soup.find(
-                    'h4', class_='gw-section-caption', string='Added by')
-                if added_by_section:
-                    parent = added_by_section.find_parent()
-                    if parent:
-                        # Find name
-                        name_elem = parent.select_one('.gw-name')
-                        if name_elem:
-                            added_by_name = name_elem.get_text(strip=True)
-
-                        # Find company description
-                        desc_elem = parent.select_one('.gw-descr')
-                        if desc_elem:
-                            added_by_company = desc_elem.get_text(strip=True)
-            except:
+                future.result()
+            except Exception:
                 pass
+        self._prefetched.clear()
+        if self.prefetch_driver:
+            release_driver(self.prefetch_driver, self.chrome_options)
+            self.prefetch_driver = None
+
+    def extract_job_data_with_driver(self, job_id: int, driver: Optional[webdriver.Chrome] = None) -> Optional[Union[JobPosting, str]]:
+        """Extract job data by rendering the job page in Chrome"""
+        driver = driver or self.driver
+        try:
+            job_url = f"{self.base_url}/jobs/{job_id}"
+            logger.info(f"Rendering job {job_id} in browser: {job_url}")
+
+            driver.get(job_url)
 
-            job = JobPosting(
-                job_id=job_id,
-                title=title.strip(),
-                company=company.strip(),
-                location=actual_location or location.strip(),  # Use actual location if found
-                # Limit description length
-                description=description.strip()[:1000],
-                # Limit requirements length
-                requirements=requirements.strip()[:500],
-                posted_date=posted_date.strip(),
-                url=job_url,
-                image_url=image_url,
-                company_logo_url=company_logo_url,
-                employment_type=employment_type,
-                industry=industry,
-                # Original location becomes job function
-                job_function=location if actual_location else None,
-                closing_date=closing_date,
-                added_by_name=added_by_name,
-                added_by_company=added_by_company
-            )
-
-            # Validate job is not empty (failsafe mechanism)
-            if self._is_empty_job(job):
+            # Wait until Angular renders the job or redirects away from it
+            try:
+                WebDriverWait(driver, JOB_PAGE_TIMEOUT).until(EC.any_of(
+                    lambda d: self._is_home_url(d.current_url),
+                    EC.presence_of_element_located((By.ID, JOB_PAGE_MARKER))
+                ))
+            except TimeoutException:
                 logger.warning(
-                    f"⚠️ Job {job_id} appears to be empty - stopping scraper as failsafe")
+                    f"Job {job_id} did not finish loading within {JOB_PAGE_TIMEOUT}s")
+
+            # Check if redirected (job doesn't exist)
+            if self.is_redirected_to_home(driver):
                 logger.info(
-                    "This may indicate a redirect that wasn't caught or incomplete page load")
-                # Save current state so next run starts from this ID
-                self.save_last_job_id(job_id)
-                return "EMPTY_JOB_STOP"  # Special return value to signal stop
+                    f"Job {job_id} doesn't exist - redirected to home page")
+                return None
 
-            logger.info(f"✅ Successfully scraped job {job_id}: {title}")
-            return job
+            return self._parse_job_page(job_id, job_url, driver.page_source)
 
         except Exception as e:
             logger.error(f"❌ Error scraping job {job_id}: {e}")
             return None
 
-    def _extract_text_by_selectors(self, soup: BeautifulSoup, selectors: List[str], default: str) -> str:
+    def _parse_job_page(self, job_id: int, job_url: str, html: str) -> Union[JobPosting, str]:
+        """Extract job information from a job page's HTML"""
+        tree = HTMLParser(html)
+
+        # Resolve all Angular ID fields in a single pass over the tree; the
+        # selector lists below only run for fields this markup did not provide
+        id_values = {}
+        for node in tree.css(ID_FIELDS_SELECTOR):
+            field = ID_FIELDS.get(node.attributes.get('id'))
+            if field and field not in id_values:
+                text = node.text(strip=True)
+                if text:
+                    id_values[field] = text
+
+        title = id_values.get('title') or self._extract_text_by_selectors(
+            tree, TITLE_SELECTORS, "Unknown Title")
+        company = id_values.get('company') or self._extract_text_by_selectors(
+            tree, COMPANY_SELECTORS, "Unknown Company")
+        location = id_values.get('location') or self._extract_text_by_selectors(
+            tree, LOCATION_SELECTORS, "Unknown Location")
+        description = id_values.get('description') or self._extract_text_by_selectors(
+            tree, DESCRIPTION_SELECTORS, "No description available")
+        requirements = self._extract_text_by_selectors(
+            tree, REQUIREMENTS_SELECTORS, "No requirements specified")
+        posted_date = self._extract_text_by_selectors(
+            tree, DATE_SELECTORS, "Unknown Date")
+        image_url = self._extract_image_url(tree, IMAGE_SELECTORS)
+
+        # Extract new fields for improved feed
+        company_logo_url = self._extract_image_url(
+            tree, COMPANY_LOGO_SELECTORS)
+        employment_type = id_values.get('employment_type') or self._extract_text_by_selectors(
+            tree, EMPLOYMENT_TYPE_SELECTORS, None)
+        industry = id_values.get('industry') or self._extract_text_by_selectors(
+            tree, INDUSTRY_SELECTORS, None)
+        actual_location = self._extract_text_by_selectors(
+            tree, ACTUAL_LOCATION_SELECTORS, None)
+
+        # Closing date ("Closing date for applications: 31/10/2025")
+        match = CLOSING_DATE_RE.search(html)
+        closing_date = unescape(match.group(0)).strip() if match else None
+
+        # Added by information
+        added_by_name = None
+        added_by_company = None
+        added_by_section = tree.css_first(ADDED_BY_SELECTOR)
+        if added_by_section and added_by_section.parent:
+            parent = added_by_section.parent
+            # Find name
+            name_elem = parent.css_first('.gw-name')
+            if name_elem:
+                added_by_name = name_elem.text(strip=True)
+
+            # Find company description
+            desc_elem = parent.css_first('.gw-descr')
+            if desc_elem:
+                added_by_company = desc_elem.text(strip=True)
+
+        job = JobPosting(
+            job_id=job_id,
+            title=title.strip(),
+            company=company.strip(),
+            location=actual_location or location.strip(),  # Use actual location if found
+            # Limit description length
+            description=description.strip()[:1000],
+            # Limit requirements length
+            requirements=requirements.strip()[:500],
+            posted_date=posted_date.strip(),
+            url=job_url,
+            image_url=image_url,
+            company_logo_url=company_logo_url,
+            employment_type=employment_type,
+            industry=industry,
+            # Original location becomes job function
+            job_function=location if actual_location else None,
+            closing_date=closing_date,
+            added_by_name=added_by_name,
+            added_by_company=added_by_company
+        )
+
+        # Validate job is not empty (failsafe mechanism)
+        if self._is_empty_job(job):
+            logger.warning(
+                f"⚠️ Job {job_id} appears to be empty - stopping scraper as failsafe")
+            logger.info(
+                "This may indicate a redirect that wasn't caught or incomplete page load")
+            return "EMPTY_JOB_STOP"  # Special return value to signal stop
+
+        logger.info(f"✅ Successfully scraped job {job_id}: {title}")
+        return job
+
+    def _extract_text_by_selectors(self, tree: HTMLParser, selectors: Tuple[str, ...], default: str) -> str:
         """Try multiple CSS selectors to extract text"""
         for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text(strip=True):
-                return element.get_text(strip=True)
+            element = tree.css_first(selector)
+            if element:
+                text = element.text(strip=True)
+                if text:
+                    return text
         return default
 
-    def _extract_image_url(self, soup: BeautifulSoup, selectors: List[str]) -> Optional[str]:
+    def _extract_image_url(self, tree: HTMLParser, selectors: Tuple[str, ...]) -> Optional[str]:
         """Try to extract image URL"""
         for selector in selectors:
-            img = soup.select_one(selector)
-            if img and img.get('src'):
-                src = img.get('src')
+            img = tree.css_first(selector)
+            src = img.attributes.get('src') if img else None
+            if src:
                 if src.startswith('http'):
                     return src
                 else:
@@ -550,18 +1305,14 @@ class EspritJobScraper:
 
     def _is_empty_job(self, job: JobPosting) -> bool:
         """Check if a job is effectively empty (failsafe for missed redirects)"""
-        # A job is considered empty if it has no meaningful content
-        empty_indicators = [
-            not job.title or job.title.strip() == "" or job.title.lower() in [
-                "unknown", "no title", "unknown title"],
-            not job.company or job.company.strip() == "" or job.company.lower() in [
-                "unknown", "unknown company", "no company"],
-            not job.description or job.description.strip() == "" or job.description.lower() in [
-                "no description available", "no description", "unknown description"] or len(job.description.strip()) < 20,
-        ]
+        # A job is considered empty if 2 or more fields have no meaningful content
+        empty = ((job.title or "").strip().lower() in UNKNOWN_TITLES) + \
+            ((job.company or "").strip().lower() in UNKNOWN_COMPANIES)
+        if empty != 1:
+            return empty >= 2
 
-        # If 2 or more indicators are true, consider it empty
-        return sum(empty_indicators) >= 2
+        description = (job.description or "").strip()
+        return len(description) < 20 or description.lower() in UNKNOWN_DESCRIPTIONS
 
     def scrape_jobs(self, max_jobs: int = 500) -> List[JobPosting]:
         """Main scraping loop"""
@@ -569,109 +1320,208 @@ class EspritJobScraper:
             logger.error("Failed to login - aborting scrape")
             return []
 
+        self.use_http = self._http_serves_job_pages()
+        return asyncio.run(self._scrape_jobs_async(max_jobs))
+
+    async def _scrape_jobs_async(self, max_jobs: int) -> List[JobPosting]:
+        """Fetch job IDs in concurrent batches and process results in ID order"""
         start_id = self.current_job_id
         logger.info(f"Starting job scraping from ID {start_id}")
 
-        jobs_scraped = 0
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-        while jobs_scraped < max_jobs:
-            job = self.extract_job_data(self.current_job_id)
+        async with self._build_http_session() as session:
+            self._executor = ThreadPoolExecutor(max_workers=2)
+            try:
+                await self._scrape_batches(session, max_jobs)
+            finally:
+                self._stop_prefetching()
+                self._prefetch_disabled = False
+                self._executor.shutdown()
+                self._executor = None
 
-            if job is None:
-                logger.info(
-                    f"No job found at ID {self.current_job_id} - reached end of available jobs")
-                logger.info("🎯 Saving progress and generating feeds...")
+        # Save the last processed job ID for next run
+        if self.current_job_id > start_id:
+            self.save_last_job_id(self.current_job_id - 1)
 
-                # Save results immediately when we hit the first missing job
-                if self.jobs_scraped:
-                    self.save_results()
-                    logger.info(
-                        f"✅ Successfully saved {len(self.jobs_scraped)} jobs")
+        logger.info(
+            f"Scraping completed. Total jobs scraped: {len(self.jobs_scraped)}")
+        return self.jobs_scraped
 
-                    # Generate feeds
-                    from generate_feeds import generate_all_feeds
-                    generate_all_feeds("data/jobs_raw.json", "data")
-                    logger.info("📰 Feeds generated successfully")
+    async def _scrape_batches(self, session: aiohttp.ClientSession, max_jobs: int) -> None:
+        """Scrape batches of job IDs until the catalog ends or max_jobs is reached"""
+        jobs_scraped = 0
+        consecutive_misses = 0
 
-                break
-            elif job == "EMPTY_JOB_STOP":
-                logger.warning(
-                    "🛑 Empty job detected - stopping as failsafe mechanism")
-                logger.info("🎯 Saving progress before stopping...")
+        while jobs_scraped < max_jobs:
+            batch_ids = range(self.current_job_id,
+                              self.current_job_id + FETCH_BATCH_SIZE)
+            batch_over_http = self.use_http or self.api_url_template is not None
+            if batch_over_http:
+                results = await asyncio.gather(
+                    *[self.extract_job_data(session, job_id) for job_id in batch_ids])
+            else:
+                results = ["NEEDS_BROWSER"] * len(batch_ids)
 
-                # Save results immediately when we detect empty job
-                if self.jobs_scraped:
-                    self.save_results()
+            for index, (job_id, job) in enumerate(zip(batch_ids, results)):
+                if job == "NEEDS_BROWSER":
+                    if index + 1 < len(results):
+                        next_needs_browser = results[index + 1] == "NEEDS_BROWSER"
+                    else:
+                        next_needs_browser = not batch_over_http
+                    job = await self._extract_with_browser(job_id, next_needs_browser)
+
+                if job is None:
+                    consecutive_misses += 1
+                    if consecutive_misses < MAX_CONSECUTIVE_MISSES:
+                        # Possibly a deleted job - keep looking past the gap
+                        self.current_job_id += 1
+                        continue
+
+                    # Resume from the first missing ID next time
+                    self.current_job_id = job_id - consecutive_misses + 1
                     logger.info(
-                        f"✅ Successfully saved {len(self.jobs_scraped)} jobs")
-
-                    # Generate feeds
-                    from generate_feeds import generate_all_feeds
-                    generate_all_feeds("data/jobs_raw.json", "data")
-                    logger.info("📰 Feeds generated successfully")
-
-                break
-            else:
-                # Check for duplicates (EXTRA EXTRA SAFETY)
-                if job.job_id in self.existing_job_ids:
+                        f"No job found at IDs {self.current_job_id}-{job_id} - reached end of available jobs")
+                    logger.info("🎯 Saving progress and generating feeds...")
+                    self._finalize()
+                    return
+                elif job == "EMPTY_JOB_STOP":
                     logger.warning(
-                        f"🔄 Duplicate detected: Job {job.job_id} already exists - skipping")
+                        "🛑 Empty job detected - stopping as failsafe mechanism")
+                    # Save current state so next run starts from this ID
+                    self.save_last_job_id(job_id)
+                    logger.info("🎯 Saving progress before stopping...")
+                    self._finalize()
+                    return
                 else:
-                    self.jobs_scraped.append(job)
-                    # Add to existing IDs set to prevent duplicates within this session
-                    self.existing_job_ids.add(job.job_id)
-                    jobs_scraped += 1
-                    logger.info(f"Jobs scraped: {jobs_scraped}")
-
-            self.current_job_id += 1
-            time.sleep(1)  # Be respectful to the server
+                    consecutive_misses = 0
+                    # Check for duplicates (EXTRA EXTRA SAFETY)
+                    if job.job_id in self.existing_job_ids:
+                        logger.warning(
+                            f"🔄 Duplicate detected: Job {job.job_id} already exists - skipping")
+                    else:
+                        self.jobs_scraped.append(job)
+                        # Add to existing IDs set to prevent duplicates within this session
+                        self.existing_job_ids.add(job.job_id)
+                        jobs_scraped += 1
+                        logger.info(f"Jobs scraped: {jobs_scraped}")
+
+                self.current_job_id += 1
+                if jobs_scraped >= max_jobs:
+                    break
+                if not batch_over_http and self.api_url_template:
+                    break  # Job API found - fetch the rest from it
+
+    def _finalize(self) -> None:
+        """Save the jobs scraped so far (save_results also regenerates the feeds)"""
+        if not self.jobs_scraped:
+            return
+        self.save_results()
+        logger.info(f"✅ Successfully saved {len(self.jobs_scraped)} jobs")
+
+    def _append_to_json_array(self, json_file: str, jobs: List[dict]) -> None:
+        """Append jobs to a JSON array file in place, keeping its 2-space indent
+
+        Only the tail of the file is touched, so the cost depends on the number
+        of new jobs rather than the size of the file.
+        """
+        if not os.path.exists(json_file):
+            with open(json_file, 'wb') as f:
+                f.write(orjson.dumps(jobs, option=orjson.OPT_INDENT_2))
+            return
+        if not jobs:
+            return
+
+        # orjson only emits raw newlines as indentation, so nesting each job
+        # one level deeper is a plain replace
+        items = [b'  ' + orjson.dumps(job, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  ')
+                 for job in jobs]
+        with open(json_file, 'r+b') as f:
+            f.seek(0, os.SEEK_END)
+            start = max(0, f.tell() - 64)
+            f.seek(start)
+            tail = f.read()
+            close = tail.rfind(b']')
+            if close == -1:
+                raise ValueError(f"{json_file} does not end with a JSON array")
+            body = tail[:close].rstrip()
+            separator = b'\n' if body.endswith(b'[') else b',\n'
+            f.seek(start + len(body))
+            f.write(separator + b',\n'.join(items) + b'\n]')
+            f.truncate()
+
+    def _append_to_job_index(self, data_dir: str, job_ids: List[int]) -> None:
+        """Add job IDs to the sorted index, rewriting it only if order would break"""
+        index_file = os.path.join(data_dir, JOBS_INDEX_FILE)
+        if os.path.exists(index_file) and os.path.getsize(index_file) > 0:
+            if not job_ids:
+                return
+            if min(job_ids) > _last_index_id(index_file):
+                with open(index_file, 'a', encoding='utf-8') as f:
+                    f.writelines(f"{job_id}\n" for job_id in sorted(job_ids))
+                return
+            with open(index_file, 'r', encoding='utf-8') as f:
+                all_ids = {int(line) for line in f if line.strip()}
+        else:
+            all_ids = set(self.existing_job_ids)
 
-        # Save the last processed job ID for next run
-        if self.current_job_id > start_id:
-            self.save_last_job_id(self.current_job_id - 1)
-
-        logger.info(
-            f"Scraping completed. Total jobs scraped: {len(self.jobs_scraped)}")
-        return self.jobs_scraped
+        all_ids.update(job_ids)
+        with open(index_file, 'w', encoding='utf-8') as f:
+            f.writelines(f"{job_id}\n" for job_id in sorted(all_ids))
 
     def save_results(self, output_dir: str = "data") -> None:
         """Save scraped results to JSON and other formats"""
         os.makedirs(output_dir, exist_ok=True)
 
-        # Save as raw JSON for feed generation
+        # Jobs are archived as NDJSON so each save only appends the new ones
+        archive_file = os.path.join(output_dir, JOBS_ARCHIVE_FILE)
         raw_json_file = os.path.join(output_dir, "jobs_raw.json")
-        
-        # Load existing jobs to merge with new ones
-        all_jobs = []
-        if os.path.exists(raw_json_file):
+
+        # Seed the archive from the JSON file (older versions, or a dropped stale cache)
+        if not os.path.exists(archive_file) and os.path.exists(raw_json_file):
             try:
-                with open(raw_json_file, 'r', encoding='utf-8') as f:
-                    all_jobs = json.load(f)
-                logger.info(f"📂 Loaded {len(all_jobs)} existing jobs from {raw_json_file}")
+                with open(raw_json_file, 'rb') as src, open(archive_file, 'wb') as dst:
+                    for job in ijson.items(src, 'item', use_float=True):
+                        dst.write(orjson.dumps(job) + b'\n')
+                logger.info(f"📂 Converted {raw_json_file} to {archive_file}")
             except Exception as e:
-                logger.warning(f"Error loading existing jobs: {e}, starting fresh")
-                all_jobs = []
-        
-        # Add new jobs to the collection
-        existing_job_ids = {job['job_id'] for job in all_jobs if 'job_id' in job}
-        new_jobs_added = 0
-        for job in self.jobs_scraped:
-            job_dict = asdict(job)
-            if job.job_id not in existing_job_ids:
-                all_jobs.append(job_dict)
-                new_jobs_added += 1
-        
-        # Write merged jobs back to file
-        with open(raw_json_file, 'w', encoding='utf-8') as f:
-            json.dump(all_jobs, f, indent=2, ensure_ascii=False)
-
-        logger.info(f"💾 Saved {new_jobs_added} new jobs (total: {len(all_jobs)} jobs) to {raw_json_file}")
+                logger.warning(f"Error converting existing jobs: {e}, starting fresh")
+                if os.path.exists(archive_file):
+                    os.remove(archive_file)
+
+        # Jobs are checked against existing_job_ids before they are accepted,
+        # so everything scraped since the last save is new to the archive
+        new_jobs = [asdict(job) for job in self.jobs_scraped[self._saved_job_count:]]
+        self._saved_job_count = len(self.jobs_scraped)
+
+        # Append the jobs to the JSON array that feed generation reads first:
+        # the caches written after it must never end up older than it
+        try:
+            self._append_to_json_array(raw_json_file, new_jobs)
+            rebuild_raw_json = False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not append to {raw_json_file}: {e}, rebuilding it")
+            rebuild_raw_json = True
+
+        with open(archive_file, 'ab') as f:
+            f.writelines(orjson.dumps(job) + b'\n' for job in new_jobs)
+
+        logger.info(f"💾 Saved {len(new_jobs)} new jobs to {archive_file}")
+
+        if rebuild_raw_json:
+            with open(archive_file, 'rb') as f:
+                all_jobs = [orjson.loads(line) for line in f if line.strip()]
+            with open(raw_json_file, 'wb') as f:
+                f.write(orjson.dumps(all_jobs, option=orjson.OPT_INDENT_2))
+
+        new_job_ids = [job['job_id'] for job in new_jobs]
+        self._append_to_job_index(output_dir, new_job_ids)
+        self._save_job_id_bloom(output_dir, new_job_ids)
 
         # Save summary with state information
-        start_id = self.load_last_job_id() if hasattr(self, 'initial_job_id') else 785
         summary = {
             "total_jobs": len(self.jobs_scraped),
-            "session_start_job_id": start_id,
+            "session_start_job_id": self.session_start_job_id,
             "session_end_job_id": self.current_job_id - 1,
             "next_job_id": self.current_job_id,
             "scraped_at": datetime.now().isoformat(),
@@ -679,17 +1529,18 @@ class EspritJobScraper:
         }
 
         summary_file = os.path.join(output_dir, "summary.json")
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        with open(summary_file, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Saved summary to {summary_file}")
 
         # Generate RSS and other feeds
+        if generate_all_feeds is None:
+            logger.warning("Could not generate feeds: generate_feeds module not available")
+            return
         try:
-            from generate_feeds import generate_all_feeds
             generate_all_feeds(raw_json_file, output_dir)
-        except ImportError as e:
-            logger.warning(f"Could not generate feeds: {e}")
+            logger.info("📰 Feeds generated successfully")
         except Exception as e:
             logger.error(f"Error generating feeds: {e}")
 
@@ -3,180 +3,255 @@
 RSS and JSON feed generator for scraped Esprit jobs
 """
 
+import html
 import json
 import os
-from datetime import datetime
-from xml.etree.ElementTree import Element, SubElement, tostring
-from xml.dom import minidom
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape, quoteattr
 from typing import List, Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Constant part of the channel; only lastBuildDate changes between builds
+RSS_HEADER = """<?xml version='1.0' encoding='utf-8'?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:atom="http://www.w3.org/2005/Atom">
+  <channel>
+    <title>Esprit Connect Jobs Feed</title>
+    <link>https://espritconnect.com/jobs</link>
+    <description>Latest job postings from Esprit Connect</description>
+    <language>en-us</language>
+    <generator>Esprit Jobs Scraper v1.0</generator>
+    <atom:link href="https://thelime1.github.io/esprit-jobs/data/feed.xml" rel="self" type="application/rss+xml"/>
+"""
+RSS_FOOTER = """  </channel>
+</rss>
+"""
 
-def smart_truncate(text: str, max_length: int = 1000) -> str:
-    """Truncate text at word boundary and add ellipsis if needed"""
-    if len(text) <= max_length:
-        return text
-
-    # Find the last space before max_length to avoid cutting words
-    last_space = text.rfind(' ', 0, max_length)
-    if last_space > max_length * 0.8:  # Only use word boundary if it's not too far back
-        return text[:last_space] + "..."
-    else:
-        return text[:max_length] + "..."
+# Placeholders for job fields that are missing from the scraped data
+NOT_AVAILABLE = "N/A"
+UNKNOWN = "Unknown"
+UNKNOWN_TITLE = "Unknown Title"
+UNKNOWN_COMPANY = "Unknown Company"
+NO_DESCRIPTION = "No description available"
+NO_REQUIREMENTS = "No requirements specified"
 
+# Tags on every JSON feed item, followed by the company name
+JSON_FEED_TAGS = ("jobs", "esprit")
 
-def create_rss_feed(jobs_data: List[Dict[str, Any]], output_file: str) -> None:
-    """Create RSS 2.0 feed from jobs data"""
+# Feeds are streamed part by part through one large write buffer
+WRITE_BUFFER_SIZE = 1024 * 1024
 
-    # Create RSS root element
-    rss = Element('rss', version='2.0')
-    rss.set('xmlns:content', 'http://purl.org/rss/1.0/modules/content/')
-    rss.set('xmlns:atom', 'http://www.w3.org/2005/Atom')
+# Date format of RSS lastBuildDate and pubDate
+RFC822_FORMAT = '%a, %d %b %Y %H:%M:%S GMT'
 
-    # Create channel
-    channel = SubElement(rss, 'channel')
+# One job card on the HTML index page
+JOB_CARD_TMPL = """
+        <div class="job-card">
+            {logo}
+            <h2 class="job-title">
+                <a href="{url}" target="_blank">
+                    {title}
+                </a>
+            </h2>
+            <div class="job-meta">
+                {meta}
+            </div>
+            <div class="job-description">
+                <p>{desc}</p>
+            </div>
+            <div style="clear: both;"></div>
+        </div>
+"""
 
-    # Channel metadata
-    title = SubElement(channel, 'title')
-    title.text = 'Esprit Connect Jobs Feed'
 
-    link = SubElement(channel, 'link')
-    link.text = 'https://espritconnect.com/jobs'
+def smart_truncate(text: str, max_length: int = 1000) -> str:
+    """Truncate text at word boundary and add ellipsis if needed"""
+    if len(text) <= max_length:
+        return text
 
-    description = SubElement(channel, 'description')
-    description.text = 'Latest job postings from Esprit Connect'
+    # Cut at the last space before max_length to avoid cutting words
+    head = text[:max_length]
+    before, space, _ = head.rpartition(' ')
+    if space and len(before) > max_length * 0.8:  # Only use word boundary if it's not too far back
+        return before + "..."
+    return head + "..."
+
+
+def _load_json(data: bytes) -> Any:
+    """Parse JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _to_rfc822(iso_date: str, fallback: str) -> str:
+    """Format an ISO timestamp for RSS, or return fallback if it is missing or invalid"""
+    if not iso_date:
+        return fallback
+    try:
+        return datetime.fromisoformat(iso_date).strftime(RFC822_FORMAT)
+    except (TypeError, ValueError):
+        return fallback
+
+
+@dataclass(slots=True)
+class JobRender:
+    """HTML fragments for one job, rendered once and shared by every output"""
+    job: Dict[str, Any]
+    escaped: Dict[str, str]
+    title_line: str
+    meta_items: List[str]
+    content_html: str
+    summary: str
+
+
+def _render_item_html(escaped: Dict[str, str], meta_items: List[str]) -> str:
+    """Build the item HTML used as RSS description/content:encoded and JSON content_html"""
+    _x = escaped.get
+
+    # Build comprehensive content HTML with company logo
+    content_parts = []
+    company_logo_url = _x('company_logo_url')
+    if company_logo_url:
+        content_parts.append(
+            f'<img src="{company_logo_url}" alt="{_x("company", "Company")} Logo" style="max-width: 200px; height: auto; margin-bottom: 10px;"/>')
+
+    content_parts.extend([
+        f'<p>Company: {_x("company", NOT_AVAILABLE)}</p>',
+        f'<p>Location: {_x("location", NOT_AVAILABLE)}</p>'
+    ])
+    content_parts.extend(f'<p>{meta}</p>' for meta in meta_items)
+    content_parts.extend([
+        '<p>Description:</p>',
+        f'<p>{_x("description", NO_DESCRIPTION)}</p>',
+        '<p>Requirements:</p>',
+        f'<p>{_x("requirements", NO_REQUIREMENTS)}</p>'
+    ])
+    return "".join(content_parts)
+
+
+def render_job(job: Dict[str, Any]) -> JobRender:
+    """Render the parts of a job that the RSS, JSON and HTML outputs share"""
+    _get = job.get
+
+    # Scraped text goes into HTML, so every string field is escaped exactly once
+    _html_esc = html.escape
+    escaped = {key: _html_esc(value)
+               for key, value in job.items() if isinstance(value, str)}
+    _x = escaped.get
+
+    employment_type = _x('employment_type')
+    industry = _x('industry')
+    job_function = _x('job_function')
+    closing_date = _x('closing_date')
+    added_by_name = _x('added_by_name')
+    added_by_company = _x('added_by_company')
+
+    # Optional metadata, shown after company and location
+    meta_items = []
+    if employment_type:
+        meta_items.append(f'Employment Type: {employment_type}')
+
+    if industry:
+        meta_items.append(f'Industry: {industry}')
+
+    if job_function:
+        meta_items.append(f'Job Function: {job_function}')
+
+    if closing_date:
+        # Extract just the date part from "Closing date for applications: 31/10/2025"
+        if ":" in closing_date:
+            date_part = closing_date.split(":", 1)[1].strip()
+            meta_items.append(
+                f'Closing Date: Closing date for applications: <strong>{date_part}</strong>')
+        else:
+            meta_items.append(f'Closing Date: <strong>{closing_date}</strong>')
+
+    # Added by information
+    if added_by_name or added_by_company:
+        added_by_info = []
+        if added_by_name:
+            added_by_info.append(f"<strong>{added_by_name}</strong>")
+        if added_by_company:
+            added_by_info.append(f"({added_by_company})")
+        meta_items.append(f'Added by: {" ".join(added_by_info)}')
+
+    # Create summary with target of 1000 characters (no truncation)
+    description = _get('description', '')
+    requirements = _get('requirements', '')
+
+    # Combine description and requirements to try to reach 1000 chars
+    combined_text = description
+    if len(combined_text) < 1000 and requirements and requirements != NO_REQUIREMENTS:
+        combined_text += f"\n\nRequirements: {requirements}"
+
+    # Use all available content, aim for 1000 but don't cut words
+    if len(combined_text) <= 1000:
+        summary = combined_text  # Use all content if 1000 chars or less
+    else:
+        summary = smart_truncate(combined_text, 1000)
 
-    language = SubElement(channel, 'language')
-    language.text = 'en-us'
+    return JobRender(
+        job=job,
+        escaped=escaped,
+        title_line=f"{_get('title', UNKNOWN)} - {_get('company', UNKNOWN_COMPANY)}",
+        meta_items=meta_items,
+        content_html=_render_item_html(escaped, meta_items),
+        summary=summary,
+    )
 
-    last_build_date = SubElement(channel, 'lastBuildDate')
-    last_build_date.text = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
 
-    generator = SubElement(channel, 'generator')
-    generator.text = 'Esprit Jobs Scraper v1.0'
+def create_rss_feed(renders: List[JobRender], output_file: str) -> None:
+    """Create RSS 2.0 feed from rendered jobs"""
 
-    # Self-reference link
-    atom_link = SubElement(channel, '{http://www.w3.org/2005/Atom}link')
-    atom_link.set(
-        'href', 'https://thelime1.github.io/esprit-jobs/data/feed.xml')
-    atom_link.set('rel', 'self')
-    atom_link.set('type', 'application/rss+xml')
+    # The feed layout is fixed, so items are written straight into a string buffer
+    _esc = escape
+    now_rfc822 = datetime.now(timezone.utc).strftime(RFC822_FORMAT)
+    parts: List[str] = [
+        RSS_HEADER, f"    <lastBuildDate>{now_rfc822}</lastBuildDate>\n"]
 
     # Add job items
-    for job in jobs_data:
-        item = SubElement(channel, 'item')
-
-        # Job title
-        item_title = SubElement(item, 'title')
-        item_title.text = f"{job.get('title', 'Unknown')} - {job.get('company', 'Unknown Company')}"
-
-        # Job URL
-        item_link = SubElement(item, 'link')
-        item_link.text = job.get('url', '')
-
-        # Job description with enhanced metadata
-        item_description = SubElement(item, 'description')
-
-        # Build comprehensive description with company logo
-        description_parts = []
-
-        # Company logo if available
-        if job.get('company_logo_url'):
-            description_parts.append(
-                f'<img src="{job.get("company_logo_url")}" alt="{job.get("company", "Company")} Logo" style="max-width: 200px; height: auto; margin-bottom: 10px;"/>')
-
-        description_parts.extend([
-            f'<p>Company: {job.get("company", "N/A")}</p>',
-            f'<p>Location: {job.get("location", "N/A")}</p>'
-        ])
-
-        # Add new metadata fields
-        if job.get('employment_type'):
-            description_parts.append(
-                f'<p>Employment Type: {job.get("employment_type")}</p>')
-
-        if job.get('industry'):
-            description_parts.append(
-                f'<p>Industry: {job.get("industry")}</p>')
-
-        if job.get('job_function'):
-            description_parts.append(
-                f'<p>Job Function: {job.get("job_function")}</p>')
-
-        if job.get('closing_date'):
-            # Extract just the date part from "Closing date for applications: 31/10/2025"
-            closing_text = job.get('closing_date')
-            if ":" in closing_text:
-                date_part = closing_text.split(":", 1)[1].strip()
-                description_parts.append(
-                    f'<p>Closing Date: Closing date for applications: <strong>{date_part}</strong></p>')
-            else:
-                description_parts.append(
-                    f'<p>Closing Date: <strong>{closing_text}</strong></p>')
-
-        # Added by information
-        if job.get('added_by_name') or job.get('added_by_company'):
-            added_by_info = []
-            if job.get('added_by_name'):
-                added_by_info.append(
-                    f"<strong>{job.get('added_by_name')}</strong>")
-            if job.get('added_by_company'):
-                added_by_info.append(f"({job.get('added_by_company')})")
-            description_parts.append(
-                f'<p>Added by: {" ".join(added_by_info)}</p>')
-
-        description_parts.extend([
-            '<p>Description:</p>',
-            f'<p>{job.get("description", "No description available")}</p>',
-            '<p>Requirements:</p>',
-            f'<p>{job.get("requirements", "No requirements specified")}</p>'
-        ])
-
-        description_text = "\n        ".join(description_parts)
-        item_description.text = description_text
-
-        # Content (full HTML)
-        content = SubElement(
-            item, '{http://purl.org/rss/1.0/modules/content/}encoded')
-        content.text = description_text
+    for render in renders:
+        _get = render.job.get
+        description_text = _esc(render.content_html)
 
         # Publication date
-        pub_date = SubElement(item, 'pubDate')
-        try:
-            scraped_date = datetime.fromisoformat(job.get('scraped_at', ''))
-            pub_date.text = scraped_date.strftime('%a, %d %b %Y %H:%M:%S GMT')
-        except:
-            pub_date.text = datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-
-        # Unique identifier
-        guid = SubElement(item, 'guid')
-        guid.set('isPermaLink', 'true')
-        guid.text = job.get('url', f"job-{job.get('job_id', 'unknown')}")
-
-        # Categories
-        category = SubElement(item, 'category')
-        category.text = 'Jobs'
+        pub_date = _to_rfc822(_get('scraped_at'), now_rfc822)
 
         # Image enclosure if available (prefer company logo)
-        image_url = job.get('company_logo_url') or job.get('image_url')
+        image_url = _get('company_logo_url') or _get('image_url')
+        enclosure = ''
         if image_url:
-            enclosure = SubElement(item, 'enclosure')
-            enclosure.set('url', image_url)
-            enclosure.set('type', 'image/jpeg')
-            enclosure.set('length', '0')
+            enclosure = f'\n      <enclosure url={quoteattr(image_url)} type="image/jpeg" length="0"/>'
 
-    # Pretty print and save
-    rough_string = tostring(rss, 'utf-8')
-    reparsed = minidom.parseString(rough_string)
-    pretty_xml = reparsed.toprettyxml(indent='  ', encoding='utf-8')
+        parts.append(f"""    <item>
+      <title>{_esc(render.title_line)}</title>
+      <link>{_esc(_get('url', ''))}</link>
+      <description>{description_text}</description>
+      <content:encoded>{description_text}</content:encoded>
+      <pubDate>{pub_date}</pubDate>
+      <guid isPermaLink="true">{_esc(_get('url', f"job-{_get('job_id', 'unknown')}"))}</guid>
+      <category>Jobs</category>{enclosure}
+    </item>
+""")
 
-    with open(output_file, 'wb') as f:
-        f.write(pretty_xml)
+    parts.append(RSS_FOOTER)
+
+    # newline='' keeps the "\n" line endings the binary writer produced
+    with open(output_file, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(parts)
 
     print(f"✅ RSS feed created: {output_file}")
 
 
-def create_json_feed(jobs_data: List[Dict[str, Any]], output_file: str) -> None:
-    """Create JSON feed from jobs data"""
+def create_json_feed(renders: List[JobRender], output_file: str, pretty: bool = False) -> None:
+    """Create JSON feed from rendered jobs (compact unless pretty is set)"""
 
     feed_data = {
         "version": "https://jsonfeed.org/version/1.1",
@@ -188,108 +263,48 @@ def create_json_feed(jobs_data: List[Dict[str, Any]], output_file: str) -> None:
         "items": []
     }
 
-    for job in jobs_data:
-        # Build comprehensive content HTML with company logo
-        content_parts = []
-
-        # Company logo if available
-        if job.get('company_logo_url'):
-            content_parts.append(
-                f'<img src="{job.get("company_logo_url")}" alt="{job.get("company", "Company")} Logo" style="max-width: 200px; height: auto; margin-bottom: 10px;"/>')
-
-        content_parts.extend([
-            f'<p>Company: {job.get("company", "N/A")}</p>',
-            f'<p>Location: {job.get("location", "N/A")}</p>'
-        ])
-
-        # Add new metadata fields
-        if job.get('employment_type'):
-            content_parts.append(
-                f'<p>Employment Type: {job.get("employment_type")}</p>')
-
-        if job.get('industry'):
-            content_parts.append(
-                f'<p>Industry: {job.get("industry")}</p>')
-
-        if job.get('job_function'):
-            content_parts.append(
-                f'<p>Job Function: {job.get("job_function")}</p>')
-
-        if job.get('closing_date'):
-            # Extract just the date part from "Closing date for applications: 31/10/2025"
-            closing_text = job.get('closing_date')
-            if ":" in closing_text:
-                date_part = closing_text.split(":", 1)[1].strip()
-                content_parts.append(
-                    f'<p>Closing Date: Closing date for applications: <strong>{date_part}</strong></p>')
-            else:
-                content_parts.append(
-                    f'<p>Closing Date: <strong>{closing_text}</strong></p>')
-
-        # Added by information
-        if job.get('added_by_name') or job.get('added_by_company'):
-            added_by_info = []
-            if job.get('added_by_name'):
-                added_by_info.append(
-                    f"<strong>{job.get('added_by_name')}</strong>")
-            if job.get('added_by_company'):
-                added_by_info.append(f"({job.get('added_by_company')})")
-            content_parts.append(
-                f'<p>Added by: {" ".join(added_by_info)}</p>')
-
-        content_parts.extend([
-            '<p>Description:</p>',
-            f'<p>{job.get("description", "No description available")}</p>',
-            '<p>Requirements:</p>',
-            f'<p>{job.get("requirements", "No requirements specified")}</p>'
-        ])
-
-        content_html = "\n            ".join(content_parts)
-
-        # Create summary with target of 1000 characters (no truncation)
-        description = job.get('description', '')
-        requirements = job.get('requirements', '')
-
-        # Combine description and requirements to try to reach 1000 chars
-        combined_text = description
-        if len(combined_text) < 1000 and requirements and requirements != "No requirements specified":
-            combined_text += f"\n\nRequirements: {requirements}"
-
-        # Use all available content, aim for 1000 but don't cut words
-        if len(combined_text) <= 1000:
-            summary = combined_text  # Use all content if 1000 chars or less
-        else:
-            summary = smart_truncate(combined_text, 1000)
+    # One slot per job, filled in order
+    items = feed_data["items"] = [None] * len(renders)
 
+    for index, render in enumerate(renders):
+        _get = render.job.get
+        url = _get('url', '')
         item = {
-            "id": str(job.get('job_id', '')),
-            "url": job.get('url', ''),
-            "title": f"{job.get('title', 'Unknown')} - {job.get('company', 'Unknown Company')}",
-            "content_html": content_html,
-            "summary": summary,
-            "date_published": job.get('scraped_at', ''),
-            "tags": ["jobs", "esprit", job.get('company', '').lower()],
-            "external_url": job.get('url', '')
+            "id": str(_get('job_id', '')),
+            "url": url,
+            "title": render.title_line,
+            "content_html": render.content_html,
+            "summary": render.summary,
+            "date_published": _get('scraped_at', ''),
+            "tags": [*JSON_FEED_TAGS, _get('company', '').lower()],
+            "external_url": url
         }
 
         # Prefer company logo, fallback to job image
-        if job.get('company_logo_url'):
-            item["image"] = job['company_logo_url']
-        elif job.get('image_url'):
-            item["image"] = job['image_url']
-
-        feed_data["items"].append(item)
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(feed_data, f, indent=2, ensure_ascii=False)
+        company_logo_url = _get('company_logo_url')
+        image_url = _get('image_url')
+        if company_logo_url:
+            item["image"] = company_logo_url
+        elif image_url:
+            item["image"] = image_url
+
+        items[index] = item
+
+    # Serialize in memory and write once rather than token by token
+    if pretty:
+        data = json.dumps(feed_data, indent=2, ensure_ascii=False)
+    else:
+        data = json.dumps(feed_data, ensure_ascii=False, separators=(',', ':'))
+    with open(output_file, 'wb') as f:
+        f.write(data.encode('utf-8'))
 
     print(f"✅ JSON feed created: {output_file}")
 
 
-def create_html_index(jobs_data: List[Dict[str, Any]], output_file: str) -> None:
+def create_html_index(renders: List[JobRender], output_file: str) -> None:
     """Create HTML index page for the jobs"""
 
-    html_content = f"""
+    header = f"""
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -369,7 +384,7 @@ def create_html_index(jobs_data: List[Dict[str, Any]], output_file: str) -> None
     </div>
     
     <div class="stats">
-        <p><strong>Total Jobs Found:</strong> {len(jobs_data)}</p>
+        <p><strong>Total Jobs Found:</strong> {len(renders)}</p>
     </div>
     
     <div class="feeds">
@@ -381,76 +396,43 @@ def create_html_index(jobs_data: List[Dict[str, Any]], output_file: str) -> None
     <div class="jobs">
 """
 
-    for job in jobs_data:
-        # Build enhanced job card with company logo and all metadata
-        job_meta_parts = []
+    # Collect the page in pieces and join once at the end
+    parts = [header]
+
+    _html_esc = html.escape
+    for render in renders:
+        _x = render.escaped.get
 
         # Company logo if available
         logo_html = ""
-        if job.get('company_logo_url'):
-            logo_html = f'<img src="{job.get("company_logo_url")}" alt="{job.get("company", "Company")} Logo" style="max-width: 150px; height: auto; float: right; margin-left: 15px; border-radius: 4px;"/>'
+        company_logo_url = _x('company_logo_url')
+        if company_logo_url:
+            logo_html = f'<img src="{company_logo_url}" alt="{_x("company", "Company")} Logo" style="max-width: 150px; height: auto; float: right; margin-left: 15px; border-radius: 4px;"/>'
 
         # Build comprehensive metadata
-        job_meta_parts.append(
-            f"Company: {job.get('company', 'Unknown')}")
-        job_meta_parts.append(
-            f"Location: {job.get('location', 'Unknown')}")
-
-        if job.get('employment_type'):
-            job_meta_parts.append(
-                f"Employment Type: {job.get('employment_type')}")
-
-        if job.get('industry'):
-            job_meta_parts.append(
-                f"Industry: {job.get('industry')}")
-
-        if job.get('job_function'):
-            job_meta_parts.append(
-                f"Job Function: {job.get('job_function')}")
-
-        if job.get('closing_date'):
-            # Extract just the date part from "Closing date for applications: 31/10/2025"
-            closing_text = job.get('closing_date')
-            if ":" in closing_text:
-                date_part = closing_text.split(":", 1)[1].strip()
-                job_meta_parts.append(
-                    f"Closing Date: Closing date for applications: <strong>{date_part}</strong>")
-            else:
-                job_meta_parts.append(
-                    f"Closing Date: <strong>{closing_text}</strong>")
-
-        # Added by information
-        if job.get('added_by_name') or job.get('added_by_company'):
-            added_by_info = []
-            if job.get('added_by_name'):
-                added_by_info.append(
-                    f"<strong>{job.get('added_by_name')}</strong>")
-            if job.get('added_by_company'):
-                added_by_info.append(f"({job.get('added_by_company')})")
-            job_meta_parts.append(
-                f"Added by: {' '.join(added_by_info)}")
-
-        job_meta_html = " | ".join(job_meta_parts)
-
-        html_content += f"""
-        <div class="job-card">
-            {logo_html}
-            <h2 class="job-title">
-                <a href="{job.get('url', '#')}" target="_blank">
-                    {job.get('title', 'Unknown Title')}
-                </a>
-            </h2>
-            <div class="job-meta">
-                {job_meta_html}
-            </div>
-            <div class="job-description">
-                <p>{smart_truncate(job.get('description', 'No description available'), 1000)}</p>
-            </div>
-            <div style="clear: both;"></div>
-        </div>
-"""
+        job_meta_html = " | ".join([
+            f"Company: {_x('company', UNKNOWN)}",
+            f"Location: {_x('location', UNKNOWN)}",
+            *render.meta_items,
+        ])
 
-    html_content += """
+        # Most descriptions fit, and those are already escaped on the render
+        description = render.job.get('description', NO_DESCRIPTION)
+        if len(description) <= 1000:
+            desc_html = _x('description', NO_DESCRIPTION)
+        else:
+            # Truncate before escaping so entities are never cut in half
+            desc_html = _html_esc(smart_truncate(description, 1000))
+
+        parts.append(JOB_CARD_TMPL.format_map({
+            'logo': logo_html,
+            'url': _x('url', '#'),
+            'title': _x('title', UNKNOWN_TITLE),
+            'meta': job_meta_html,
+            'desc': desc_html,
+        }))
+
+    parts.append("""
     </div>
     
     <footer style="text-align: center; margin-top: 40px; color: #666;">
@@ -459,15 +441,15 @@ def create_html_index(jobs_data: List[Dict[str, Any]], output_file: str) -> None
     </footer>
 </body>
 </html>
-"""
+""")
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(parts)
 
     print(f"✅ HTML index created: {output_file}")
 
 
-def generate_all_feeds(json_file: str, output_dir: str) -> None:
+def generate_all_feeds(json_file: str, output_dir: str, pretty: bool = False) -> None:
     """Generate all feed formats from jobs JSON file"""
 
     if not os.path.exists(json_file):
@@ -475,8 +457,8 @@ def generate_all_feeds(json_file: str, output_dir: str) -> None:
         return
 
     # Load jobs data
-    with open(json_file, 'r', encoding='utf-8') as f:
-        jobs_data = json.load(f)
+    with open(json_file, 'rb') as f:
+        jobs_data = _load_json(f.read())
 
     # Sort jobs by job_id in descending order (newest first)
     jobs_data.sort(key=lambda job: job.get('job_id', 0), reverse=True)
@@ -486,10 +468,21 @@ def generate_all_feeds(json_file: str, output_dir: str) -> None:
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
 
-    # Generate feeds
-    create_rss_feed(jobs_data, os.path.join(output_dir, 'feed.xml'))
-    create_json_feed(jobs_data, os.path.join(output_dir, 'jobs.json'))
-    create_html_index(jobs_data, os.path.join(output_dir, 'index.html'))
+    # Render the shared per-job HTML once for all outputs
+    renders = [render_job(job) for job in jobs_data]
+
+    # Generate feeds; the outputs are independent, so write them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(create_rss_feed, renders,
+                            os.path.join(output_dir, 'feed.xml')),
+            executor.submit(create_json_feed, renders,
+                            os.path.join(output_dir, 'jobs.json'), pretty),
+            executor.submit(create_html_index, renders,
+                            os.path.join(output_dir, 'index.html')),
+        ]
+        for future in futures:
+            future.result()
 
     print("🎉 All feeds generated successfully!")
 
@@ -500,7 +493,8 @@ if __name__ == "__main__":
     output_dir = "data"
 
     if os.path.exists(input_file):
-        generate_all_feeds(input_file, output_dir)
+        # --pretty writes an indented, human-readable jobs.json
+        generate_all_feeds(input_file, output_dir, pretty="--pretty" in sys.argv)
     else:
         print(f"❌ No jobs file found at {input_file}")
         print("Run the scraper first: python esprit_job_scraper.py")